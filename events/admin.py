@@ -24,6 +24,7 @@ class AttendeeResource(resources.ModelResource):
             "events__title",
             "has_attended",
         )
+        clean_model_instances = True
 
 
 class EventResource(resources.ModelResource):
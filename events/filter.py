@@ -1,7 +1,15 @@
 """Collection of filters."""
+from typing import Any, Optional
+
+from django.contrib.postgres.search import SearchQuery
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+from django.db.models import QuerySet
 from django_filters import rest_framework as filters
+from rest_framework.filters import SearchFilter
+from rest_framework.request import Request
 
-from .models import Event
+from .models import SEARCH_CONFIG, SEARCH_VECTOR_FIELDS, Event
 
 
 class EventFilter(filters.FilterSet):
@@ -11,6 +19,8 @@ class EventFilter(filters.FilterSet):
 
     event_date = filters.DateFromToRangeFilter("event_date")
 
+    form_class: Optional[Any] = None
+
     class Meta:
         """Meta data."""
 
@@ -20,3 +30,73 @@ class EventFilter(filters.FilterSet):
             "read_time",
             "event_date",
         )
+
+    def get_form_class(self: "EventFilter") -> Any:
+        """Return the form class, building it only once per filterset class."""
+        filterset_class = type(self)
+
+        if filterset_class.__dict__.get("form_class") is None:
+            filterset_class.form_class = super().get_form_class()
+
+        return filterset_class.form_class
+
+
+def escape_lexeme(term: str) -> str:
+    """Escape a search term so it can be quoted inside a raw tsquery.
+
+    Args:
+        term: a single search term.
+
+    Returns:
+        the escaped term.
+    """
+    return term.replace("\\", "\\\\").replace("'", "''")
+
+
+class FullTextSearchFilter(SearchFilter):
+    """Search the indexed search vector on PostgreSQL, fall back to SearchFilter.
+
+    The view search_fields must be the fields of the search vector, so both
+    backends search the same fields.
+    """
+
+    def filter_queryset(
+        self: "FullTextSearchFilter", request: Request, queryset: QuerySet, view: Any
+    ) -> QuerySet:
+        """Filter the queryset with the search terms.
+
+        Args:
+            request: Request object
+            queryset: the queryset to filter.
+            view: Any type of view
+
+        Returns:
+            the filtered queryset.
+
+        Raises:
+            ImproperlyConfigured: if the view search_fields are not the fields of
+                the search vector.
+        """
+        search_fields = self.get_search_fields(view, request)
+
+        if search_fields and set(search_fields) != set(SEARCH_VECTOR_FIELDS):
+            raise ImproperlyConfigured(
+                f"{view.__class__.__name__}.search_fields must be "
+                f"{SEARCH_VECTOR_FIELDS} to use FullTextSearchFilter."
+            )
+
+        if connections[queryset.db].vendor != "postgresql":
+            return super().filter_queryset(request, queryset, view)
+
+        search_terms = self.get_search_terms(request)
+
+        if not search_fields or not search_terms:
+            return queryset
+
+        prefix_terms = (f"'{escape_lexeme(term)}':*" for term in search_terms)
+
+        return queryset.filter(
+            search_vector=SearchQuery(
+                " & ".join(prefix_terms), config=SEARCH_CONFIG, search_type="raw"
+            )
+        )
@@ -0,0 +1,21 @@
+# Generated by Django 3.0.14 on 2026-10-15 04:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['event_date'], name='events_even_event_d_2c2da5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['events', 'status'], name='events_sess_events__07572a_idx'),
+        ),
+    ]
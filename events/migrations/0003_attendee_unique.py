@@ -0,0 +1,60 @@
+# Generated by Django 3.0.14 on 2026-10-15 04:32
+
+from django.conf import settings
+from django.db import migrations
+from django.db.models import Count
+
+
+def remove_duplicate_attendees(apps, schema_editor):
+    """Merge duplicate sign ups before (user, events) becomes unique.
+
+    The oldest row of each pair is kept and takes has_attended=True, or
+    else False, from any of its duplicates, so no attendance is lost.
+    """
+    Attendee = apps.get_model('events', 'Attendee')
+    attendees = Attendee.objects.using(schema_editor.connection.alias)
+    duplicates = attendees.values('user_id', 'events_id').annotate(
+        total=Count('pk')
+    ).filter(total__gt=1)
+    removed = 0
+
+    for duplicate in duplicates:
+        rows = list(
+            attendees.filter(
+                user_id=duplicate['user_id'], events_id=duplicate['events_id']
+            ).order_by('pk')
+        )
+        kept = rows[0]
+        flags = {row.has_attended for row in rows}
+
+        if True in flags:
+            has_attended = True
+        elif False in flags:
+            has_attended = False
+        else:
+            has_attended = None
+
+        if kept.has_attended != has_attended:
+            kept.has_attended = has_attended
+            kept.save(update_fields=['has_attended'])
+
+        removed += attendees.filter(pk__in=[row.pk for row in rows[1:]]).delete()[0]
+
+    if removed:
+        print(f'\n  Removed {removed} duplicate attendee rows.')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('events', '0002_event_session_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_attendees, migrations.RunPython.noop),
+        migrations.AlterUniqueTogether(
+            name='attendee',
+            unique_together={('user', 'events')},
+        ),
+    ]
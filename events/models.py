@@ -1,14 +1,28 @@
 """Collection of model."""
+import uuid
 from typing import Any
 
 from django.conf import settings
-from django.db import models
-from django.db.models.signals import pre_save
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.core.cache import caches
+from django.db import connections, models
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 
 from .utils import get_read_time, unique_slug
 
+TAG_LIST_CACHE = "tags"
+
+TAG_LIST_CACHE_KEY = "events:tags"
+
+TAG_LIST_VERSION_KEY = "events:tags:version"
+
+SEARCH_CONFIG = "simple"
+
+SEARCH_VECTOR_FIELDS = ("title", "description")
+
 
 def event_upload_to(instance: "Event", filename: str) -> str:
     """A help Function to change the image upload path.
@@ -86,6 +100,10 @@ class Event(models.Model):
         blank=True,
     )
 
+    search_vector = SearchVectorField(
+        verbose_name=_("search vector"), null=True, editable=False
+    )
+
     created_at = models.DateTimeField(verbose_name=_("created at"), auto_now_add=True)
 
     updated_at = models.DateTimeField(verbose_name=_("updated at"), auto_now=True)
@@ -97,6 +115,11 @@ class Event(models.Model):
 
         verbose_name_plural = _("events")
 
+        indexes = [
+            models.Index(fields=["event_date"]),
+            GinIndex(fields=["search_vector"]),
+        ]
+
     def __str__(self: "Event") -> str:
         """It return readable name for the model."""
         return f"{self.title}"
@@ -194,6 +217,8 @@ class Attendee(models.Model):
 
         verbose_name_plural = _("attendees")
 
+        unique_together = (("user", "events"),)
+
     def __str__(self: "Attendee") -> str:
         """It return readable name for the model."""
         return f"{self.user}"
@@ -244,6 +269,10 @@ class Session(models.Model):
         db_index=True,
     )
 
+    search_vector = SearchVectorField(
+        verbose_name=_("search vector"), null=True, editable=False
+    )
+
     created_at = models.DateTimeField(verbose_name=_("created at"), auto_now_add=True)
 
     updated_at = models.DateTimeField(verbose_name=_("updated at"), auto_now=True)
@@ -255,6 +284,11 @@ class Session(models.Model):
 
         verbose_name_plural = _("sessions")
 
+        indexes = [
+            models.Index(fields=["events", "status"]),
+            GinIndex(fields=["search_vector"]),
+        ]
+
     def __str__(self: "Session") -> str:
         """It return readable name for the model."""
         return f"{self.title}"
@@ -275,3 +309,32 @@ def event_creator(sender: Event, instance: Event, **kwargs: Any) -> None:
 
     if instance.description:
         instance.read_time = get_read_time(words=instance.description)
+
+
+@receiver(post_save, sender=Session)
+@receiver(post_save, sender=Event)
+def search_vector_updater(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Single for updating the full text search vector on PostgreSQL."""
+    update_fields = kwargs.get("update_fields")
+
+    if update_fields is not None and update_fields.isdisjoint(SEARCH_VECTOR_FIELDS):
+        return
+
+    if connections[instance._state.db].vendor == "postgresql":
+        sender.objects.filter(pk=instance.pk).update(
+            search_vector=SearchVector(*SEARCH_VECTOR_FIELDS, config=SEARCH_CONFIG)
+        )
+
+
+@receiver([post_save, post_delete], sender=Tag)
+@receiver(post_delete, sender=Event)
+def tag_list_cache_cleaner(sender: Any, **kwargs: Any) -> None:
+    """Single for moving the cached tag list to a new version."""
+    caches[TAG_LIST_CACHE].set(TAG_LIST_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+@receiver(m2m_changed, sender=Event.tags.through)
+def event_tags_cache_cleaner(sender: Any, action: str, **kwargs: Any) -> None:
+    """Single for moving the cached tag list once the event tags changed."""
+    if action in ("post_add", "post_remove", "post_clear"):
+        tag_list_cache_cleaner(sender, **kwargs)
@@ -1,10 +1,212 @@
 """Collection of serializers."""
-from rest_framework import serializers
+import copy
+import inspect
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, List, Tuple
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import models
+from rest_framework import fields, serializers
+from rest_framework.fields import BuiltinSignatureError, Field, SkipField, empty
+from rest_framework.relations import PKOnlyObject
 
 from .models import Event, Session, Tag
 
+simple_callable_methods: Dict[Tuple[type, Any], bool] = {}
+
+
+def is_simple_callable(obj: Any) -> bool:
+    """Check if obj can be called without arguments, memoized for bound methods.
+
+    Args:
+        obj: the attribute value read by a serializer field.
+
+    Returns:
+        True if the object can be called without arguments.
+    """
+    if not inspect.ismethod(obj):
+        return fields.is_simple_callable(obj)
+
+    key = (type(obj.__self__), obj.__func__)
+
+    if key not in simple_callable_methods:
+        simple_callable_methods[key] = fields.is_simple_callable(obj)
+
+    return simple_callable_methods[key]
+
+
+def get_attribute(instance: Any, attrs: List[str]) -> Any:
+    """Walk the source attributes like DRF's get_attribute.
+
+    Args:
+        instance: the object to serialize.
+        attrs: the source attributes of the field.
+
+    Returns:
+        the attribute value.
+
+    Raises:
+        ValueError: if a callable attribute raised KeyError or AttributeError.
+    """
+    for attr in attrs:
+        try:
+            if isinstance(instance, Mapping):
+                instance = instance[attr]
+            else:
+                instance = getattr(instance, attr)
+        except ObjectDoesNotExist:
+            return None
+
+        if is_simple_callable(instance):
+            try:
+                instance = instance()
+            except (KeyError, AttributeError) as exc:
+                raise ValueError(
+                    f'Exception raised in callable attribute "{attr}"; '
+                    f"original exception was: {exc}"
+                ) from exc
+
+    return instance
+
+
+def get_field_attribute(field: Field, instance: Any) -> Any:
+    """Read the value of the field from the instance.
+
+    Same as Field.get_attribute, but callables are checked with the memoized
+    is_simple_callable. Fields with their own get_attribute keep using it.
+
+    Args:
+        field: a bound readable field.
+        instance: the object to serialize.
+
+    Returns:
+        the attribute value.
+
+    Raises:
+        BuiltinSignatureError: if the source maps to a built-in function.
+        KeyError: if the source is missing from a dict and the field is required.
+        AttributeError: if the source is missing and the field is required.
+        SkipField: if the source is missing and the field is not required.
+    """
+    if type(field).get_attribute is not Field.get_attribute:
+        return field.get_attribute(instance)
+
+    try:
+        return get_attribute(instance, field.source_attrs)
+    except BuiltinSignatureError as exc:
+        raise type(exc)(
+            f"Field source for `{field.parent.__class__.__name__}."
+            f"{field.field_name}` maps to a built-in function type and is "
+            f"invalid. Define a property or method on the "
+            f"`{instance.__class__.__name__}` instance that wraps the call to "
+            f"the built-in function."
+        ) from exc
+    except (KeyError, AttributeError) as exc:
+        if field.default is not empty:
+            return field.get_default()
+        if field.allow_null:
+            return None
+        if not field.required:
+            raise SkipField() from exc
+        raise type(exc)(
+            f"Got {type(exc).__name__} when attempting to get a value for field "
+            f"`{field.field_name}` on serializer "
+            f"`{field.parent.__class__.__name__}`.\nThe serializer field might "
+            f"be named incorrectly and not match any attribute or key on the "
+            f"`{instance.__class__.__name__}` instance.\nOriginal exception "
+            f"text was: {exc}."
+        ) from exc
+
+
+class FastListSerializer(serializers.ListSerializer):
+    """List serializer that binds the child readable fields once per list."""
+
+    def to_representation(self: "FastListSerializer", data: Any) -> List[Dict]:
+        """Serialize every item using the same list of readable fields.
+
+        Args:
+            data: a queryset, manager or iterable of objects.
+
+        Returns:
+            list of serialized objects as plain dicts.
+        """
+        iterable = data.all() if isinstance(data, models.Manager) else data
+
+        fields = self.child.readable_fields()
+
+        return [self.child.serialize_fields(item, fields) for item in iterable]
+
+    @property
+    def data(self: "FastListSerializer") -> List[Dict]:
+        """Return the serialized data as a plain list, cheap to pickle and cache."""
+        return list(super().data)
+
+
+class BaseSerializer(serializers.Serializer):
+    """Base serializer for read only representations."""
+
+    class Meta:
+        """Meta data."""
+
+        list_serializer_class = FastListSerializer
+
+    def to_representation(self: "BaseSerializer", instance: Any) -> Dict:
+        """Object instance -> Dict of primitive datatypes."""
+        return self.serialize_fields(instance, self._readable_fields)
+
+    def readable_fields(self: "BaseSerializer") -> List[Field]:
+        """Return the bound fields that are included in the representation."""
+        return list(self._readable_fields)
+
+    def serialize_fields(
+        self: "BaseSerializer", instance: Any, fields: Iterable[Field]
+    ) -> Dict:
+        """Serialize the instance using the given readable fields.
+
+        Args:
+            instance: the object to serialize.
+            fields: the already bound readable fields.
+
+        Returns:
+            Dict of primitive datatypes.
+        """
+        ret = {}
+
+        for field in fields:
+            try:
+                attribute = get_field_attribute(field, instance)
+            except SkipField:
+                continue
+
+            check_for_none = (
+                attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+            )
+            if check_for_none is None:
+                ret[field.field_name] = None
+            else:
+                ret[field.field_name] = field.to_representation(attribute)
+
+        return ret
+
+
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """Model serializer that introspects the model only once per class."""
+
+    def get_fields(self: "CachedFieldsModelSerializer") -> Dict[str, Field]:
+        """Return a fresh copy of the fields built for the serializer class.
 
-class ProfileSerializer(serializers.Serializer):
+        Returns:
+            the serializer fields.
+        """
+        serializer_class = type(self)
+
+        if "cached_fields" not in serializer_class.__dict__:
+            serializer_class.cached_fields = super().get_fields()
+
+        return copy.deepcopy(serializer_class.cached_fields)
+
+
+class ProfileSerializer(BaseSerializer):
     """Serializer to get username and picture of owner of the event."""
 
     username = serializers.CharField(read_only=True)
@@ -12,19 +214,19 @@ class ProfileSerializer(serializers.Serializer):
     picture = serializers.ImageField(read_only=True)
 
 
-class AttendeeSerializer(serializers.Serializer):
+class AttendeeSerializer(BaseSerializer):
     """Serializer For attendees."""
 
     user = ProfileSerializer(read_only=True)
 
 
-class SpeakerSerializer(serializers.Serializer):
+class SpeakerSerializer(BaseSerializer):
     """Serializer For attendees."""
 
     proposed_by = ProfileSerializer(read_only=True)
 
 
-class TagSerializer(serializers.Serializer):
+class TagSerializer(BaseSerializer):
     """Tag serializer."""
 
     name = serializers.CharField(read_only=True)
@@ -48,7 +250,7 @@ class TagStringSerializer(serializers.StringRelatedField):
         return tag.id
 
 
-class EventListSerializer(serializers.Serializer):
+class EventListSerializer(BaseSerializer):
     """Event List Serializer."""
 
     title = serializers.CharField(read_only=True)
@@ -70,7 +272,7 @@ class EventListSerializer(serializers.Serializer):
     tags = serializers.StringRelatedField(read_only=True, many=True)
 
 
-class EventRetrieveSerializer(serializers.Serializer):
+class EventRetrieveSerializer(BaseSerializer):
     """Event Retrieve Serializer."""
 
     title = serializers.CharField(read_only=True)
@@ -113,8 +315,14 @@ class EventRetrieveSerializer(serializers.Serializer):
 
     total_workshop = serializers.IntegerField(read_only=True)
 
+    has_sign_up = serializers.BooleanField(read_only=True)
+
+    event_is_open = serializers.BooleanField(read_only=True)
+
+    is_authenticated = serializers.BooleanField(read_only=True)
+
 
-class EventCreateUpdateSerializer(serializers.ModelSerializer):
+class EventCreateUpdateSerializer(CachedFieldsModelSerializer):
     """Event Create Update Serializer."""
 
     tags = TagStringSerializer(many=True)
@@ -128,7 +336,7 @@ class EventCreateUpdateSerializer(serializers.ModelSerializer):
         fields = ("title", "description", "cover", "total_guest", "event_date", "tags")
 
 
-class SessionRetrieveCreateUpdateSerializer(serializers.ModelSerializer):
+class SessionRetrieveCreateUpdateSerializer(CachedFieldsModelSerializer):
     """Session Retrieve Create Update Serializer."""
 
     status = serializers.CharField(read_only=True)
@@ -141,7 +349,7 @@ class SessionRetrieveCreateUpdateSerializer(serializers.ModelSerializer):
         fields = ("title", "description", "session_type", "status", "proposed_by")
 
 
-class SessionListSerializer(serializers.Serializer):
+class SessionListSerializer(BaseSerializer):
     """Session List Serializer."""
 
     title = serializers.CharField(read_only=True)
@@ -0,0 +1,73 @@
+"""Tests for the events filters."""
+from datetime import timedelta
+from typing import Any, List
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from rest_framework.test import APIClient, APIRequestFactory
+
+from events.models import Event
+from events.views import EventListCreateAPIView
+from users.models import CustomUser
+
+
+@pytest.fixture
+def events() -> List[Event]:
+    """Upcoming events with distinct words in their title and description."""
+    host = CustomUser.objects.create_user(username="host", email="host@example.com")
+    return [
+        Event.objects.create(
+            title=title,
+            description=description,
+            event_date=timezone.now() + timedelta(days=7),
+            hosted_by=host,
+        )
+        for title, description in (
+            ("Introduction to Angular", "Components and routing."),
+            ("Python conferences", "Talks about typing."),
+        )
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "search, titles",
+    [
+        ("conferen", ["Python conferences"]),
+        ("an", ["Introduction to Angular"]),
+        ("TYPING", ["Python conferences"]),
+        ("introduction angular", ["Introduction to Angular"]),
+        ("routing talks", []),
+        ("o'reilly", []),
+    ],
+)
+def test_search_matches_word_prefixes(
+    events: List[Event], search: str, titles: List[str]
+) -> None:
+    """Prefixes and stop words match on every database backend."""
+    response = APIClient().get("/api/events/", {"search": search}, secure=True)
+
+    assert [event["title"] for event in response.json()["results"]] == titles
+
+
+@pytest.mark.django_db
+def test_saving_unrelated_fields_does_not_update_the_search_vector(
+    events: List[Event], django_assert_num_queries: Any
+) -> None:
+    """save(update_fields=...) without title or description runs one query."""
+    event = events[0]
+    event.total_guest = 10
+
+    with django_assert_num_queries(1):
+        event.save(update_fields=["total_guest"])
+
+
+@pytest.mark.django_db
+def test_search_fields_must_be_the_search_vector_fields() -> None:
+    """A view searching other fields is reported instead of being ignored."""
+    view = EventListCreateAPIView.as_view(search_fields=("title",))
+    request = APIRequestFactory().get("/api/events/", {"search": "python"})
+
+    with pytest.raises(ImproperlyConfigured):
+        view(request)
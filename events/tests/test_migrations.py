@@ -0,0 +1,46 @@
+"""Tests for the events migrations."""
+import pytest
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.utils import timezone
+
+BEFORE_UNIQUE_ATTENDEE = [
+    ("events", "0002_event_session_indexes"),
+    ("users", "0002_customuser_updated_at"),
+]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_duplicate_attendees_are_merged_without_losing_attendance() -> None:
+    """The oldest duplicate is kept and takes the recorded attendance."""
+    executor = MigrationExecutor(connection)
+    executor.migrate(BEFORE_UNIQUE_ATTENDEE)
+    apps = executor.loader.project_state(BEFORE_UNIQUE_ATTENDEE).apps
+    user_model = apps.get_model("users", "CustomUser")
+    event_model = apps.get_model("events", "Event")
+    attendee_model = apps.get_model("events", "Attendee")
+
+    host = user_model.objects.create(username="host", email="host@example.com")
+    guest = user_model.objects.create(username="guest", email="guest@example.com")
+    other = user_model.objects.create(username="other", email="other@example.com")
+    event = event_model.objects.create(
+        title="Conference",
+        description="A conference.",
+        slug="conference",
+        event_date=timezone.now(),
+        hosted_by=host,
+    )
+    kept = attendee_model.objects.create(user=guest, events=event, has_attended=None)
+    attendee_model.objects.create(user=guest, events=event, has_attended=False)
+    attendee_model.objects.create(user=guest, events=event, has_attended=True)
+    single = attendee_model.objects.create(user=other, events=event)
+
+    executor = MigrationExecutor(connection)
+    executor.migrate(executor.loader.graph.leaf_nodes())
+    attendee_model = executor.loader.project_state().apps.get_model(
+        "events", "Attendee"
+    )
+
+    assert list(
+        attendee_model.objects.order_by("pk").values_list("pk", "has_attended")
+    ) == [(kept.pk, True), (single.pk, None)]
@@ -0,0 +1,142 @@
+"""Tests for the events serializers."""
+from typing import Any, Dict, List, Optional
+
+import pytest
+from django.core.exceptions import ObjectDoesNotExist
+from rest_framework import serializers
+
+from events.serializers import BaseSerializer, FastListSerializer
+
+
+class Owner:
+    """Plain object used as a nested instance."""
+
+    def __init__(self: "Owner", name: str) -> None:
+        """Set the owner name."""
+        self.name = name
+
+    def display(self: "Owner") -> str:
+        """Callable attribute read by the serializers."""
+        return self.name.upper()
+
+
+class Item:
+    """Plain object covering the lookups done by the serializers."""
+
+    def __init__(
+        self: "Item", title: str, owner: Optional[Owner], extra: Dict[str, Any]
+    ) -> None:
+        """Set the item attributes."""
+        self.title = title
+        self.owner = owner
+        self.extra = extra
+        self.calls = 0
+
+    @property
+    def missing(self: "Item") -> Any:
+        """A relation whose row does not exist."""
+        raise ObjectDoesNotExist
+
+    def broken(self: "Item") -> str:
+        """A callable attribute that fails."""
+        self.calls += 1
+        raise KeyError("broken")
+
+
+class StockOwnerSerializer(serializers.Serializer):
+    """Owner serializer using DRF's own representation."""
+
+    name = serializers.CharField()
+
+    display = serializers.CharField()
+
+
+class StockItemSerializer(serializers.Serializer):
+    """Item serializer using DRF's own representation."""
+
+    title = serializers.CharField()
+
+    owner = StockOwnerSerializer(allow_null=True)
+
+    owner_name = serializers.CharField(source="owner.name", default="nobody")
+
+    code = serializers.CharField(source="extra.code", allow_null=True)
+
+    note = serializers.CharField(required=False)
+
+    missing_name = serializers.CharField(source="missing.name")
+
+
+class FastOwnerSerializer(BaseSerializer):
+    """Owner serializer using BaseSerializer."""
+
+    name = serializers.CharField()
+
+    display = serializers.CharField()
+
+
+class FastItemSerializer(BaseSerializer):
+    """Item serializer using BaseSerializer."""
+
+    title = serializers.CharField()
+
+    owner = FastOwnerSerializer(allow_null=True)
+
+    owner_name = serializers.CharField(source="owner.name", default="nobody")
+
+    code = serializers.CharField(source="extra.code", allow_null=True)
+
+    note = serializers.CharField(required=False)
+
+    missing_name = serializers.CharField(source="missing.name")
+
+
+class StockBrokenSerializer(serializers.Serializer):
+    """Serializer reading a failing callable with DRF's own representation."""
+
+    broken = serializers.CharField()
+
+
+class FastBrokenSerializer(BaseSerializer):
+    """Serializer reading a failing callable with BaseSerializer."""
+
+    broken = serializers.CharField()
+
+
+@pytest.fixture
+def items() -> List[Item]:
+    """Items with and without nested objects and keys."""
+    return [
+        Item("first", Owner("ada"), {"code": "A1"}),
+        Item("second", None, {"code": None}),
+        Item("third", Owner("bob"), {}),
+    ]
+
+
+def test_base_serializer_matches_drf(items: List[Item]) -> None:
+    """Nested, source, None and ObjectDoesNotExist values match DRF."""
+    for item in items:
+        assert FastItemSerializer(item).data == StockItemSerializer(item).data
+
+
+def test_fast_list_serializer_matches_drf(items: List[Item]) -> None:
+    """many=True gives the same items as DRF, as a plain list."""
+    fast = FastItemSerializer(items, many=True)
+
+    assert isinstance(fast, FastListSerializer)
+    assert type(fast.data) is list
+    assert fast.data == StockItemSerializer(items, many=True).data
+
+
+def test_failing_callable_is_called_once_like_drf() -> None:
+    """A callable raising KeyError gives DRF's ValueError after a single call."""
+    stock_item = Item("stock", None, {})
+    fast_item = Item("fast", None, {})
+
+    with pytest.raises(ValueError) as stock_error:
+        StockBrokenSerializer(stock_item).data
+    with pytest.raises(ValueError) as fast_error:
+        FastBrokenSerializer(fast_item).data
+
+    assert str(fast_error.value) == str(stock_error.value)
+    assert fast_item.calls == stock_item.calls == 1
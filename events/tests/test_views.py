@@ -0,0 +1,129 @@
+"""Tests for the events views."""
+from datetime import timedelta
+from typing import Any
+from unittest import mock
+
+import pytest
+from django.core.cache import caches
+from django.utils import timezone
+from rest_framework.permissions import AllowAny, IsAdminUser
+from rest_framework.test import APIClient, APIRequestFactory
+
+from events.models import TAG_LIST_CACHE, Attendee, Event, Tag
+from events.views import EventListCreateAPIView
+from users.models import CustomUser
+
+
+@pytest.fixture
+def event() -> Event:
+    """An upcoming event hosted by its own user."""
+    host = CustomUser.objects.create_user(username="host", email="host@example.com")
+    return Event.objects.create(
+        title="Conference",
+        description="A conference.",
+        event_date=timezone.now() + timedelta(days=7),
+        hosted_by=host,
+    )
+
+
+@pytest.mark.django_db
+def test_attendee_list_etag_changes_when_attendee_user_changes(event: Event) -> None:
+    """Renaming an attendee must not be answered with 304 Not Modified."""
+    user = CustomUser.objects.create_user(username="guest", email="guest@example.com")
+    Attendee.objects.create(user=user, events=event)
+    client = APIClient()
+    url = f"/api/events/{event.slug}/attendees/"
+
+    response = client.get(url, secure=True)
+    etag = response["ETag"]
+
+    assert client.get(url, secure=True, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    user.username = "renamed"
+    user.save()
+    response = client.get(url, secure=True, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+    assert b"renamed" in b"".join(response.streaming_content)
+
+
+@pytest.mark.django_db
+def test_views_built_with_different_permissions_do_not_share_them(
+    event: Event,
+) -> None:
+    """as_view(permission_classes=...) must be honoured for every view."""
+    factory = APIRequestFactory()
+    allow_any = EventListCreateAPIView.as_view(permission_classes=[AllowAny])
+    admin_only = EventListCreateAPIView.as_view(permission_classes=[IsAdminUser])
+
+    assert allow_any(factory.get("/api/events/")).status_code == 200
+    assert admin_only(factory.get("/api/events/")).status_code == 403
+    assert allow_any(factory.get("/api/events/")).status_code == 200
+
+
+@pytest.mark.django_db
+def test_tag_list_cache_follows_tag_and_event_changes(
+    event: Event, django_assert_num_queries: Any
+) -> None:
+    """Tag saves, event tag changes and event deletes refresh list and ETag."""
+    client = APIClient()
+    url = "/api/events/tags/"
+    etag = client.get(url, secure=True)["ETag"]
+
+    tag = Tag.objects.create(name="python")
+    response = client.get(url, secure=True, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+    assert response.json() == [{"name": "python", "total_events": 0}]
+    assert response["ETag"] != etag
+
+    etag = response["ETag"]
+
+    with django_assert_num_queries(1):
+        response = client.get(url, secure=True, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+
+    event.tags.add(tag)
+    response = client.get(url, secure=True, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+    assert response.json() == [{"name": "python", "total_events": 1}]
+    assert response["ETag"] != etag
+
+    etag = response["ETag"]
+    event.delete()
+    response = client.get(url, secure=True, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+    assert response.json() == [{"name": "python", "total_events": 0}]
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_event_tag_changes_move_the_tag_list_version_once(event: Event) -> None:
+    """Only the post_* m2m_changed actions write to the tag list cache."""
+    tag = Tag.objects.create(name="python")
+
+    with mock.patch.object(caches[TAG_LIST_CACHE], "set") as cache_set:
+        event.tags.add(tag)
+        event.tags.remove(tag)
+        event.tags.clear()
+
+    assert cache_set.call_count == 3
+
+
+@pytest.mark.django_db
+def test_signing_up_twice_is_reported_as_already_attended(event: Event) -> None:
+    """The unique attendee rule turns a second sign up into a clear error."""
+    user = CustomUser.objects.create_user(username="guest", email="guest@example.com")
+    client = APIClient()
+    client.force_authenticate(user)
+    url = f"/api/events/{event.slug}/signup/"
+
+    assert client.post(url, secure=True).status_code == 201
+
+    response = client.post(url, secure=True)
+
+    assert response.json() == {"detail": f"You already attended the {event.title}."}
+    assert Attendee.objects.filter(user=user, events=event).count() == 1
@@ -1,58 +1,190 @@
 """Collection views."""
-from typing import Any, Dict, List, Tuple
-
-from django.utils import timezone
+import uuid
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from django.core.cache import caches
+from django.db import IntegrityError, transaction
+from django.db.models import (
+    BooleanField,
+    Count,
+    Exists,
+    ExpressionWrapper,
+    F,
+    IntegerField,
+    Max,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+    Value,
+)
+from django.db.models.functions import Coalesce, Now
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from django.views.decorators.http import condition
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import exceptions, generics, permissions, status
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.filters import OrderingFilter
 from rest_framework.generics import get_object_or_404
+from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
 
 from . import filter
 from . import permissions as custom_permissions
 from . import serializers
-from .models import Attendee, Event, Session, Tag
+from .models import (
+    TAG_LIST_CACHE,
+    TAG_LIST_CACHE_KEY,
+    TAG_LIST_VERSION_KEY,
+    Attendee,
+    Event,
+    Session,
+    Tag,
+)
+
+
+class CachedPermissionsMixin:
+    """Reuse the permission instances of the view, they hold no request state."""
+
+    cached_permissions: Dict[Tuple[Any, ...], List[permissions.BasePermission]] = {}
+
+    def get_permissions(self: Any) -> List[permissions.BasePermission]:
+        """Instantiate each set of permission classes only once."""
+        permission_classes = tuple(self.permission_classes)
+
+        if permission_classes not in self.cached_permissions:
+            self.cached_permissions[permission_classes] = [
+                permission() for permission in permission_classes
+            ]
+
+        return self.cached_permissions[permission_classes]
+
+
+def count_of(queryset: QuerySet) -> Coalesce:
+    """Build a correlated subquery counting the rows of the event.
+
+    Args:
+        queryset: attendees or sessions filtered by events=OuterRef("pk").
+
+    Returns:
+        expression that evaluate to the number of rows, 0 if there is none.
+    """
+    total = queryset.values("events").annotate(total=Count("pk")).values("total")
+
+    return Coalesce(Subquery(total, output_field=IntegerField()), 0)
+
+
+def stream_json_list(
+    serializer: serializers.BaseSerializer, queryset: QuerySet
+) -> Iterator[bytes]:
+    """Serialize a queryset into a JSON array chunk by chunk.
+
+    Args:
+        serializer: the serializer used for every object.
+        queryset: the objects to serialize, fetched 500 at a time.
+
+    Yields:
+        pieces of the JSON array.
+    """
+    renderer = JSONRenderer()
+    fields = serializer.readable_fields()
+
+    yield b"["
+
+    for index, instance in enumerate(queryset.iterator(chunk_size=500)):
+        item = renderer.render(serializer.serialize_fields(instance, fields))
+        yield b"," + item if index else item
+
+    yield b"]"
+
+
+def attendee_list_etag(request: Request, event_slug: str) -> Optional[str]:
+    """Get the etag of the attendee list from its attendees and their users.
+
+    Args:
+        request: Request object
+        event_slug: the slug of the event.
+
+    Returns:
+        the etag, or None if the event has no attendees.
+    """
+    attendees = Attendee.objects.filter(events__slug=event_slug).aggregate(
+        total=Count("pk"), last=Max("updated_at"), last_user=Max("user__updated_at")
+    )
+    if not attendees["total"]:
+        return None
+
+    return (
+        f"{attendees['total']}-{attendees['last'].timestamp()}"
+        f"-{attendees['last_user'].timestamp()}"
+    )
 
 
 @api_view(["GET"])
 def list_of_tag(request: Request) -> Response:
     """List API Point for tag model."""
-    tags = Tag.objects.all()
-    serializer = serializers.TagSerializer(tags, many=True)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    tag_cache = caches[TAG_LIST_CACHE]
+    cached = tag_cache.get_many([TAG_LIST_VERSION_KEY, TAG_LIST_CACHE_KEY])
+    version = cached.get(TAG_LIST_VERSION_KEY)
+    tags = cached.get(TAG_LIST_CACHE_KEY)
+
+    if version is None:
+        version = tag_cache.get_or_set(
+            TAG_LIST_VERSION_KEY, lambda: uuid.uuid4().hex, None
+        )
+
+    if tags is None or tags["version"] != version:
+        tags = {
+            "version": version,
+            "etag": quote_etag(version),
+            "data": serializers.TagSerializer(Tag.objects.all(), many=True).data,
+        }
+        tag_cache.set(TAG_LIST_CACHE_KEY, tags, 60 * 5)
+
+    not_modified = get_conditional_response(request, etag=tags["etag"])
+    if not_modified is not None:
+        not_modified["ETag"] = tags["etag"]
+        return not_modified
+    return Response(
+        tags["data"], status=status.HTTP_200_OK, headers={"ETag": tags["etag"]}
+    )
 
 
 @api_view(["POST"])
 @permission_classes([permissions.IsAuthenticated])
 def sign_up_to_event(request: Request, slug: str) -> Response:
     """Let users to signup to an event."""
-    event = get_object_or_404(Event, slug=slug)
-    if event.hosted_by == request.user:
+    event = (
+        Event.objects.filter(slug=slug).values("pk", "hosted_by_id", "title").first()
+    )
+    if event is None:
+        raise exceptions.NotFound()
+    if event["hosted_by_id"] == request.user.id:
         raise exceptions.APIException(
-            f"You are the owner of the {event.title}.", code=status.HTTP_400_BAD_REQUEST
+            f"You are the owner of the {event['title']}.",
+            code=status.HTTP_400_BAD_REQUEST,
         )
-    if event.attendees.filter(user=request.user).first():
+    try:
+        with transaction.atomic():
+            Attendee.objects.create(user=request.user, events_id=event["pk"])
+
+    except IntegrityError:
         raise exceptions.APIException(
-            f"You already attended the {event.title}.", code=status.HTTP_400_BAD_REQUEST
+            f"You already attended the {event['title']}.",
+            code=status.HTTP_400_BAD_REQUEST,
         )
-    Attendee(user=request.user, events=event).save()
     return Response(status=status.HTTP_201_CREATED)
 
 
-class EventListCreateAPIView(generics.ListCreateAPIView):
+class EventListCreateAPIView(CachedPermissionsMixin, generics.ListCreateAPIView):
     """Event API view for create and list."""
 
-    queryset = (
-        Event.objects.select_related("hosted_by")
-        .prefetch_related("tags")
-        .filter(event_date__gt=timezone.now())
-    )
-
     permission_classes = (permissions.IsAuthenticatedOrReadOnly,)
 
-    filter_backends = (DjangoFilterBackend, OrderingFilter, SearchFilter)
+    filter_backends = (DjangoFilterBackend, OrderingFilter, filter.FullTextSearchFilter)
 
     filterset_class = filter.EventFilter
 
@@ -62,6 +194,24 @@ class EventListCreateAPIView(generics.ListCreateAPIView):
 
     ordering_fields = ("total_guest", "event_date", "read_time")
 
+    def get_queryset(self: "EventListCreateAPIView") -> QuerySet:
+        """Override get_queryset."""
+        return (
+            Event.objects.select_related("hosted_by")
+            .prefetch_related("tags")
+            .filter(event_date__gt=Now())
+            .only(
+                "title",
+                "event_date",
+                "total_guest",
+                "read_time",
+                "slug",
+                "cover",
+                "hosted_by__username",
+                "hosted_by__picture",
+            )
+        )
+
     def get_serializer_class(
         self: "EventListCreateAPIView", *args: Tuple, **kwargs: Any
     ) -> Any:
@@ -78,14 +228,11 @@ class EventListCreateAPIView(generics.ListCreateAPIView):
         serializer.save(hosted_by=self.request.user)
 
 
-class EventRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
+class EventRetrieveUpdateDestroyAPIView(
+    CachedPermissionsMixin, generics.RetrieveUpdateDestroyAPIView
+):
     """Event API view for retrieve, update, and delete."""
 
-    queryset = (
-        Event.objects.select_related("hosted_by")
-        .prefetch_related("organizers", "tags")
-        .all()
-    )
     permission_classes = (
         permissions.IsAuthenticatedOrReadOnly,
         custom_permissions.IsOwnerOrReadOnly,
@@ -93,6 +240,51 @@ class EventRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
 
     lookup_field = "slug"
 
+    def get_queryset(self: "EventRetrieveUpdateDestroyAPIView") -> QuerySet:
+        """Override get_queryset."""
+        queryset = Event.objects.select_related("hosted_by").prefetch_related(
+            "organizers", "tags"
+        )
+
+        if self.request.method != "GET":
+            return queryset
+
+        if self.request.user.is_authenticated:
+            has_sign_up = Exists(
+                Attendee.objects.filter(events=OuterRef("pk"), user=self.request.user)
+            )
+
+        else:
+            has_sign_up = Value(False, output_field=BooleanField())
+
+        attendees = Attendee.objects.filter(events=OuterRef("pk"))
+        sessions = Session.objects.filter(events=OuterRef("pk"))
+        accepted = sessions.filter(status="Accepted")
+
+        return queryset.annotate(
+            has_sign_up=has_sign_up,
+            event_is_open=ExpressionWrapper(
+                Q(event_date__gt=Now()), output_field=BooleanField()
+            ),
+            is_authenticated=Value(
+                self.request.user.is_authenticated, output_field=BooleanField()
+            ),
+            total_attendees=count_of(attendees),
+            total_attended=count_of(attendees.filter(has_attended=True)),
+            total_not_attended=count_of(attendees.filter(has_attended=False)),
+            total_sessions=count_of(sessions),
+            total_draft_sessions=count_of(sessions.filter(status="Draft")),
+            total_accepted_sessions=count_of(accepted),
+            total_denied_sessions=count_of(sessions.filter(status="Denied")),
+            total_talk=count_of(accepted.filter(session_type="Talk")),
+            total_lighting_talk=count_of(accepted.filter(session_type="Lighting Talk")),
+            total_workshop=count_of(accepted.filter(session_type="WorkShop")),
+        ).annotate(
+            available_place=ExpressionWrapper(
+                F("total_guest") - F("total_attendees"), output_field=IntegerField()
+            )
+        )
+
     def get_serializer_class(
         self: "EventListCreateAPIView", *args: Tuple, **kwargs: Any
     ) -> Any:
@@ -104,44 +296,13 @@ class EventRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
         else:
             return serializers.EventCreateUpdateSerializer
 
-    def retrieve(
-        self: "EventRetrieveUpdateDestroyAPIView",
-        request: Request,
-        *args: Tuple,
-        **kwargs: Dict,
-    ) -> Response:
-        """Event retrieve endpoint."""
-        try:
-            event = self.get_queryset().get(slug=kwargs.get("slug"))
-
-        except Exception:
-            raise exceptions.NotFound()
-
-        serializer = self.get_serializer(event)
 
-        data = serializer.data
-
-        if request.user.is_authenticated and event.attendees.filter(user=request.user):
-            data.update({"has_sign_up": True})
-
-        else:
-            data.update({"has_sign_up": False})
-
-        data.update(
-            {
-                "event_is_open": event.event_date > timezone.now(),
-                "is_authenticated": request.user.is_authenticated,
-            }
-        )
-        return Response(data, status=status.HTTP_200_OK)
-
-
-class ProposerListCreateAPIView(generics.ListCreateAPIView):
+class ProposerListCreateAPIView(CachedPermissionsMixin, generics.ListCreateAPIView):
     """Proposer API view for create and list."""
 
     permission_classes = (permissions.IsAuthenticatedOrReadOnly,)
 
-    filter_backends = (OrderingFilter, SearchFilter)
+    filter_backends = (OrderingFilter, filter.FullTextSearchFilter)
 
     search_fields = ("title", "description")
     ordering = ("title",)
@@ -150,9 +311,9 @@ class ProposerListCreateAPIView(generics.ListCreateAPIView):
 
     def get_queryset(self: "ProposerListCreateAPIView") -> List[Session]:
         """Override get_queryset."""
-        return Session.objects.filter(status="Draft").filter(
-            events__slug=self.kwargs.get("event_slug")
-        )
+        return Session.objects.filter(
+            status="Draft", events__slug=self.kwargs.get("event_slug")
+        ).select_related("proposed_by")
 
     def get_serializer_class(
         self: "ProposerListCreateAPIView", *args: Tuple, **kwargs: Any
@@ -171,7 +332,9 @@ class ProposerListCreateAPIView(generics.ListCreateAPIView):
         serializer.save(proposed_by=self.request.user, events=event)
 
 
-class ProposerRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
+class ProposerRetrieveUpdateDestroyAPIView(
+    CachedPermissionsMixin, generics.RetrieveUpdateDestroyAPIView
+):
     """Proposer API view for retrieve, update, and delete."""
 
     serializer_class = serializers.SessionRetrieveCreateUpdateSerializer
@@ -184,17 +347,17 @@ class ProposerRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView
 
     def get_queryset(self: "ProposerRetrieveUpdateDestroyAPIView") -> List[Session]:
         """Override get_queryset."""
-        return Session.objects.filter(status="Draft").filter(
-            events__slug=self.kwargs.get("event_slug")
-        )
+        return Session.objects.filter(
+            status="Draft", events__slug=self.kwargs.get("event_slug")
+        ).select_related("proposed_by")
 
 
-class SessionListAPIView(generics.ListAPIView):
+class SessionListAPIView(CachedPermissionsMixin, generics.ListAPIView):
     """Session API view for accepted session list."""
 
     serializer_class = serializers.SessionListSerializer
 
-    filter_backends = (OrderingFilter, SearchFilter)
+    filter_backends = (OrderingFilter, filter.FullTextSearchFilter)
 
     search_fields = ("title", "description")
 
@@ -204,12 +367,12 @@ class SessionListAPIView(generics.ListAPIView):
 
     def get_queryset(self: "SessionListAPIView") -> List[Session]:
         """Override get_queryset."""
-        return Session.objects.filter(status="Accepted").filter(
-            events__slug=self.kwargs.get("event_slug")
-        )
+        return Session.objects.filter(
+            status="Accepted", events__slug=self.kwargs.get("event_slug")
+        ).select_related("proposed_by")
 
 
-class SessionRetrieveAPIView(generics.RetrieveAPIView):
+class SessionRetrieveAPIView(CachedPermissionsMixin, generics.RetrieveAPIView):
     """Session API view for accepted session retrieve."""
 
     serializer_class = serializers.SessionRetrieveCreateUpdateSerializer
@@ -218,17 +381,17 @@ class SessionRetrieveAPIView(generics.RetrieveAPIView):
 
     def get_queryset(self: "SessionRetrieveAPIView") -> List[Session]:
         """Override get_queryset."""
-        return Session.objects.filter(status="Accepted").filter(
-            events__slug=self.kwargs.get("event_slug")
-        )
+        return Session.objects.filter(
+            status="Accepted", events__slug=self.kwargs.get("event_slug")
+        ).select_related("proposed_by")
 
 
-class DeniedSessionListAPIView(generics.ListAPIView):
+class DeniedSessionListAPIView(CachedPermissionsMixin, generics.ListAPIView):
     """Session API view for denied session list."""
 
     serializer_class = serializers.SessionListSerializer
 
-    filter_backends = (OrderingFilter, SearchFilter)
+    filter_backends = (OrderingFilter, filter.FullTextSearchFilter)
 
     search_fields = ("title", "description")
 
@@ -238,12 +401,12 @@ class DeniedSessionListAPIView(generics.ListAPIView):
 
     def get_queryset(self: "DeniedSessionListAPIView") -> List[Session]:
         """Override get_queryset."""
-        return Session.objects.filter(status="Denied").filter(
-            events__slug=self.kwargs.get("event_slug")
-        )
+        return Session.objects.filter(
+            status="Denied", events__slug=self.kwargs.get("event_slug")
+        ).select_related("proposed_by")
 
 
-class DeniedSessionRetrieveAPIView(generics.RetrieveAPIView):
+class DeniedSessionRetrieveAPIView(CachedPermissionsMixin, generics.RetrieveAPIView):
     """Session API view for denied session retrieve."""
 
     serializer_class = serializers.SessionRetrieveCreateUpdateSerializer
@@ -252,24 +415,29 @@ class DeniedSessionRetrieveAPIView(generics.RetrieveAPIView):
 
     def get_queryset(self: "DeniedSessionRetrieveAPIView") -> List[Session]:
         """Override get_queryset."""
-        return Session.objects.filter(status="Denied").filter(
-            events__slug=self.kwargs.get("event_slug")
-        )
+        return Session.objects.filter(
+            status="Denied", events__slug=self.kwargs.get("event_slug")
+        ).select_related("proposed_by")
 
 
 @api_view(["GET"])
-def attendee_list(request: Request, event_slug: str) -> Response:
+@condition(etag_func=attendee_list_etag)
+def attendee_list(request: Request, event_slug: str) -> StreamingHttpResponse:
     """Get list of attendee in the event."""
-    event = get_object_or_404(Event, slug=event_slug)
-    attendees = event.attendees.all()
-    serializer = serializers.AttendeeSerializer(attendees, many=True)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    event = get_object_or_404(Event.objects.only("pk"), slug=event_slug)
+    attendees = Attendee.objects.filter(events=event).select_related("user")
+    return StreamingHttpResponse(
+        stream_json_list(serializers.AttendeeSerializer(), attendees),
+        content_type="application/json",
+    )
 
 
 @api_view(["GET"])
-def speakers_list(request: Request, event_slug: str) -> Response:
+def speakers_list(request: Request, event_slug: str) -> StreamingHttpResponse:
     """Get list of speaker in the event."""
-    event = get_object_or_404(Event, slug=event_slug)
-    sessions = event.sessions.filter(status="Accepted")
-    serializer = serializers.SpeakerSerializer(sessions, many=True)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    event = get_object_or_404(Event.objects.only("pk"), slug=event_slug)
+    sessions = event.sessions.filter(status="Accepted").select_related("proposed_by")
+    return StreamingHttpResponse(
+        stream_json_list(serializers.SpeakerSerializer(), sessions),
+        content_type="application/json",
+    )
@@ -246,6 +246,18 @@ DATABASES = {
     "default": config("DATABASE_URL", cast=db_url, default="sqlite:///db.sqlite3")
 }
 
+# CACHES
+# ------------------------------------------------------------------------------
+# https://docs.djangoproject.com/en/dev/ref/settings/#caches
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    # Shared by every worker so a tag change is seen by all of them at once.
+    "tags": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "cache_table",
+    },
+}
+
 # Third-Party Settings
 # djangorestframework
 # ------------------------------------------------------------------------------
@@ -36,6 +36,8 @@ class CustomUser(AbstractUser):
         upload_to=user_upload_to,
     )
 
+    updated_at = models.DateTimeField(verbose_name=_("updated at"), auto_now=True)
+
     class Meta:
         """Meta data."""
 